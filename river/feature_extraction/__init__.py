@@ -10,11 +10,12 @@ from .agg import Agg, TargetAgg
 from .kernel_approx import RBFSampler
 from .lag import Lagger, TargetLagger
 from .poly import PolynomialExtender
-from .vectorize import TFIDF, BagOfWords
+from .vectorize import TFIDF, BagOfWords, HashingBagOfWords
 
 __all__ = [
     "Agg",
     "BagOfWords",
+    "HashingBagOfWords",
     "Lagger",
     "PolynomialExtender",
     "RBFSampler",
@@ -0,0 +1,119 @@
+import collections
+import pickle
+
+import pytest
+
+from river import feature_extraction
+from river.feature_extraction import vectorize, vectorize_c
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        pytest.param("", id="empty"),
+        pytest.param("This is the first document.", id="ascii"),
+        pytest.param("a b c I x", id="single-characters"),
+        pytest.param("Café naïve Über ÉCOLE déjà-vu", id="accented"),
+        pytest.param("2021 covid19 3.14 ²³ ½ Ⅷ ٣٤", id="digits"),
+        pytest.param("snake_case __init__ _ a_ _b", id="underscores"),
+        pytest.param("東京 タワー Москва Ελλάδα مرحبا עברית", id="non-latin"),
+        pytest.param("e\u0301te\u0301 cafe\u0301", id="combining-marks"),
+        pytest.param("tab\tnew\nline\r\n nb\u00a0sp em\u2003space", id="whitespace"),
+        pytest.param("don't stop-me now!!! (ok?) [yes]", id="punctuation"),
+    ],
+)
+@pytest.mark.parametrize(
+    "count_tokens",
+    [
+        pytest.param(vectorize_c.count_tokens, id="cython"),
+        pytest.param(vectorize._count_tokens_py, id="python"),
+    ],
+)
+def test_count_tokens_matches_default_tokenizer(count_tokens, text):
+    expected = collections.Counter(vectorize._TOKEN_FINDALL(text))
+    counts = count_tokens(text)
+    assert isinstance(counts, collections.Counter)
+    assert counts == expected
+    # The order of insertion determines how the Counter is displayed
+    assert list(counts) == list(expected)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        pytest.param("\u00e9t\u00e9", "ete", id="composed"),
+        pytest.param("e\u0301te\u0301", "ete", id="decomposed"),
+    ],
+)
+def test_strip_accents(text, expected):
+    """Text that is already decomposed also has its combining marks removed."""
+    assert vectorize.strip_accents_unicode(text) == expected
+    assert vectorize._strip_accents_and_lowercase(text.upper()) == expected
+    assert feature_extraction.BagOfWords().transform_one(text) == {expected: 1}
+
+
+CORPUS = [
+    "This is the first document.",
+    "This document is the second document.",
+    "And this is the third one.",
+    "Is this the first document?",
+]
+
+
+def test_tfidf_df_buckets_without_collisions():
+    """With enough buckets, hashing the document counts doesn't change the TF-IDF values."""
+
+    exact = feature_extraction.TFIDF()
+    hashed = feature_extraction.TFIDF(df_buckets=2 ** 20)
+
+    for sentence in CORPUS:
+        exact.learn_one(sentence)
+        hashed.learn_one(sentence)
+        assert exact.transform_one(sentence) == pytest.approx(
+            hashed.transform_one(sentence)
+        )
+
+
+def test_tfidf_df_buckets_with_collisions():
+    """Colliding terms of the same document only count once towards the bucket they share."""
+
+    tfidf = feature_extraction.TFIDF(df_buckets=1)
+
+    for sentence in ["aa bb cc dd ee ff gg", *CORPUS, ""]:
+        tfidf.learn_one(sentence)
+        assert tfidf.dfs[0] <= tfidf.n
+        assert all(v > 0 for v in tfidf.transform_one(sentence).values())
+
+
+def test_processing_steps_are_read_only():
+    """The processing steps are compiled when the vectorizer is created, hence they can't be
+    changed afterwards."""
+
+    bow = feature_extraction.BagOfWords(lowercase=False)
+    assert isinstance(bow.processing_steps, tuple)
+    with pytest.raises(AttributeError):
+        bow.processing_steps = []
+
+
+@pytest.mark.parametrize("df_buckets", [None, 2 ** 10])
+@pytest.mark.parametrize("normalize", [True, False])
+def test_tfidf_short_and_long_documents_agree(df_buckets, normalize):
+    """Short documents are handled in plain Python, and long ones with NumPy."""
+
+    short = feature_extraction.TFIDF(normalize=normalize, df_buckets=df_buckets)
+    long = feature_extraction.TFIDF(normalize=normalize, df_buckets=df_buckets)
+    long._NUMPY_MIN_TERMS = 0
+
+    for sentence in CORPUS:
+        short.learn_one(sentence)
+        long.learn_one(sentence)
+        assert short.transform_one(sentence) == pytest.approx(
+            long.transform_one(sentence)
+        )
+
+
+def test_default_tokenizer_is_recognized_after_pickling():
+    bow = pickle.loads(pickle.dumps(feature_extraction.BagOfWords()))
+    assert bow.tokenizer is vectorize._TOKEN_FINDALL
+    assert bow.processing_steps[-1] is vectorize._TOKEN_FINDALL
+    assert bow.transform_one("Hello hello world") == {"hello": 2, "world": 1}
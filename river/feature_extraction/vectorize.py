@@ -6,28 +6,103 @@ import operator
 import re
 import typing
 import unicodedata
+import zlib
 
+import numpy as np
 import pandas as pd
 from scipy import sparse
 
 from river import base
 
-__all__ = ["BagOfWords", "TFIDF"]
+__all__ = ["BagOfWords", "HashingBagOfWords", "TFIDF"]
 
 
 N_GRAM = typing.Union[str, typing.Tuple[str, ...]]  # unigram  # n-gram
 
+# The default tokenizer, which is compiled once and shared by every vectorizer
+_TOKEN_RE = re.compile(r"(?u)\b\w\w+\b")
+_TOKEN_FINDALL = _TOKEN_RE.findall
+
+
+def _count_tokens_py(text: str) -> collections.Counter:
+    """Count the tokens matched by the default tokenizer.
+
+    This is used in place of `vectorize_c.count_tokens` when the extension is not available.
+
+    """
+    return collections.Counter(_TOKEN_FINDALL(text))
+
+
+try:
+    from .vectorize_c import count_tokens
+except ImportError:
+    count_tokens = _count_tokens_py
+
 
 def strip_accents_unicode(s: str) -> str:
     """Transform accentuated unicode symbols into their ASCII counterpart."""
-    try:
-        # If `s` is ASCII-compatible, then it does not contain any accented
-        # characters and we can avoid an expensive list comprehension
-        s.encode("ASCII", errors="strict")
+    # If `s` is ASCII-compatible, then it does not contain any accented characters and we can
+    # avoid the NFKD normalization altogether
+    if s.isascii():
         return s
-    except UnicodeEncodeError:
-        normalized = unicodedata.normalize("NFKD", s)
-        return "".join([c for c in normalized if not unicodedata.combining(c)])
+    normalized = unicodedata.normalize("NFKD", s)
+    return "".join([c for c in normalized if not unicodedata.combining(c)])
+
+
+def _strip_accents_and_lowercase(s: str) -> str:
+    """Strip accents and lowercase in a single step, which is the default preprocessing."""
+    # str.lower already has a dedicated loop for ASCII strings in CPython, it is faster than going
+    # through bytes.translate with a lowercase table and back
+    if s.isascii():
+        return s.lower()
+    return strip_accents_unicode(s).lower()
+
+
+def _hash_token(token: N_GRAM) -> int:
+    """Hash a token, in the same way across Python processes."""
+    if isinstance(token, tuple):
+        token = " ".join(token)
+    return zlib.crc32(token.encode("utf8"))
+
+
+def _compile_steps(
+    steps: typing.Sequence[typing.Callable], count=False
+) -> typing.Callable:
+    """Compile a list of processing steps into a single function.
+
+    The body of the function is generated so that the steps are applied one after the other,
+    without having to loop over them. If `count` is `True`, the function returns the number of
+    occurrences of each token instead of the tokens themselves.
+
+    Examples
+    --------
+
+    >>> process = _compile_steps([str.strip, str.lower, str.split], count=True)
+    >>> process(' Hello hello world ')
+    Counter({'hello': 2, 'world': 1})
+
+    """
+    namespace = {"Counter": collections.Counter, "count_tokens": count_tokens}
+    lines = ["def process(x):"]
+
+    if count and steps and steps[-1] is _TOKEN_FINDALL:
+        # The default tokenizer can count the tokens without building a list of them first
+        steps, output = steps[:-1], "count_tokens(x)"
+    elif count:
+        output = "Counter(x)"
+    else:
+        output = "x"
+
+    for i, step in enumerate(steps):
+        if step is str.lower:
+            lines.append("    x = x.lower()")
+        else:
+            namespace[f"step_{i}"] = step
+            lines.append(f"    x = step_{i}(x)")
+    lines.append(f"    return {output}")
+
+    exec("\n".join(lines), namespace)
+    return namespace["process"]
 
 
 def find_ngrams(tokens: typing.List[str], n: int) -> typing.Iterator[N_GRAM]:
@@ -106,8 +181,10 @@ class VectorizerMixin:
 
     Attributes
     ----------
-    processing_steps : list
-        A list of preprocessing steps that are applied to each text.
+    processing_steps : tuple
+        The processing steps that are applied to each text. These are determined by the
+        parameters and compiled into a single function when the vectorizer is created, therefore
+        they are read-only.
 
     """
 
@@ -124,43 +201,77 @@ class VectorizerMixin:
         self.strip_accents = strip_accents
         self.lowercase = lowercase
         self.preprocessor = preprocessor
-        self.tokenizer = (
-            re.compile(r"(?u)\b\w\w+\b").findall if tokenizer is None else tokenizer
-        )
+        self.tokenizer = _TOKEN_FINDALL if tokenizer is None else tokenizer
         self.ngram_range = ngram_range
 
-        self.processing_steps = []
+        steps = []
 
         # Text extraction
         if on is not None:
-            self.processing_steps.append(operator.itemgetter(on))
+            steps.append(operator.itemgetter(on))
 
         # Preprocessing
         if preprocessor is not None:
-            self.processing_steps.append(preprocessor)
+            steps.append(preprocessor)
+        elif self.strip_accents and self.lowercase:
+            steps.append(_strip_accents_and_lowercase)
         else:
             if self.strip_accents:
-                self.processing_steps.append(strip_accents_unicode)
+                steps.append(strip_accents_unicode)
             if self.lowercase:
-                self.processing_steps.append(str.lower)
+                steps.append(str.lower)
 
         # Tokenization
         if self.tokenizer:
-            self.processing_steps.append(self.tokenizer)
+            steps.append(self.tokenizer)
 
         # n-grams
         if ngram_range[1] > 1:
-            self.processing_steps.append(
+            steps.append(
                 functools.partial(
                     find_all_ngrams,
                     ngram_range=range(ngram_range[0], ngram_range[1] + 1),
                 )
             )
 
+        self._processing_steps = tuple(steps)
+
+        self._compile_processing_steps()
+
+    def _compile_processing_steps(self):
+        # The options are known at this point, therefore the processing steps are compiled into
+        # specialized functions which don't have to check them for each text
+        self._process_text = _compile_steps(self._processing_steps)
+        self._count_tokens = _compile_steps(self._processing_steps, count=True)
+
+    def __getstate__(self):
+        # Generated functions can't be pickled, they are compiled again when unpickling
+        state = self.__dict__.copy()
+        del state["_process_text"]
+        del state["_count_tokens"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+        # Unpickling creates a new bound method for the default tokenizer, therefore the shared one
+        # is put back so that _compile_steps can still recognize it
+        def restore(step):
+            owner = getattr(step, "__self__", None)
+            if isinstance(owner, re.Pattern) and owner == _TOKEN_RE:
+                return _TOKEN_FINDALL
+            return step
+
+        self.tokenizer = restore(self.tokenizer)
+        self._processing_steps = tuple(map(restore, self._processing_steps))
+        self._compile_processing_steps()
+
+    @property
+    def processing_steps(self) -> typing.Tuple[typing.Callable, ...]:
+        return self._processing_steps
+
     def process_text(self, x):
-        for step in self.processing_steps:
-            x = step(x)
-        return x
+        return self._process_text(x)
 
     def _more_tags(self):
         if self.on is None:
@@ -274,7 +385,7 @@ class BagOfWords(base.Transformer, VectorizerMixin):
     """
 
     def transform_one(self, x):
-        return collections.Counter(self.process_text(x))
+        return self._count_tokens(x)
 
     def transform_many(self, X: pd.Series) -> pd.DataFrame:
         """Transform pandas series of string into term-frequency pandas sparse dataframe."""
@@ -282,7 +393,7 @@ class BagOfWords(base.Transformer, VectorizerMixin):
         index = {}
 
         for d in X:
-            for t, f in collections.Counter(self.process_text(d)).items():
+            for t, f in self._count_tokens(d).items():
                 indices.append(index.setdefault(t, len(index)))
                 data.append(f)
 
@@ -298,6 +409,138 @@ class BagOfWords(base.Transformer, VectorizerMixin):
         return self
 
 
+class HashingBagOfWords(BagOfWords):
+    """Counts tokens in sentences, using the hashing trick.
+
+    This is the same as `feature_extraction.BagOfWords`, except that each token is hashed into one
+    of `n_features` buckets. The output therefore never has more than `n_features` distinct keys,
+    no matter how large the vocabulary of the stream is, which bounds the memory used by the
+    downstream model. The price to pay is that distinct tokens may collide in the same bucket.
+
+    This is similar to `feature_extraction.BagOfWords() | preprocessing.FeatureHasher()`, but in a
+    single step. Moreover, n-grams are supported, and the signs can be alternated to reduce the
+    impact of collisions. Note that both produce different buckets, because they use different
+    hash functions.
+
+    Indeed, `preprocessing.FeatureHasher` uses a salted BLAKE2 hash, whereas tokens are hashed here
+    with CRC32, which is about ten times faster and gives the same results across Python processes.
+    Because CRC32 is linear, changing its initial value would not change which tokens of the same
+    length collide, hence there is no `seed` parameter.
+
+    Parameters
+    ----------
+    n_features
+        The number of buckets into which the tokens are hashed. The default value is the same as
+        that of `preprocessing.FeatureHasher`.
+    alternate_sign
+        Whether or not to flip the sign of the counts of half of the tokens. This makes the
+        collisions cancel out on average, instead of piling up.
+    on
+        The name of the feature that contains the text to vectorize. If `None`, then the input is
+        treated as a document instead of a set of features.
+    strip_accents
+        Whether or not to strip accent characters.
+    lowercase
+        Whether or not to convert all characters to lowercase.
+    preprocessor
+        Override the preprocessing step while preserving the tokenizing and n-grams generation
+        steps.
+    tokenizer
+        A function used to convert preprocessed text into a `dict` of tokens. By default, a regex
+        formula that works well in most cases is used.
+    ngram_range
+        The lower and upper boundary of the range n-grams to be extracted. All values of n such
+        that `min_n <= n <= max_n` will be used. For example an `ngram_range` of `(1, 1)` means
+        only unigrams, `(1, 2)` means unigrams and bigrams, and `(2, 2)` means only bigrams.
+
+    Examples
+    --------
+
+    >>> from river import feature_extraction as fx
+
+    >>> corpus = [
+    ...     'This is the first document.',
+    ...     'This document is the second document.',
+    ...     'And this is the third one.',
+    ...     'Is this the first document?',
+    ... ]
+
+    >>> hbow = fx.HashingBagOfWords(n_features=1000)
+
+    >>> for sentence in corpus:
+    ...     print(hbow.transform_one(sentence))
+    Counter({391: 1, 78: 1, 751: -1, 119: -1, 382: -1})
+    Counter({391: 1, 78: 1, 751: -1, 385: -1, 382: -2})
+    Counter({621: 1, 391: 1, 78: 1, 868: 1, 785: 1, 751: -1})
+    Counter({391: 1, 78: 1, 751: -1, 119: -1, 382: -1})
+
+    The signs can be left untouched so that the actual counts are returned:
+
+    >>> hbow = fx.HashingBagOfWords(n_features=1000, alternate_sign=False)
+    >>> hbow.transform_one(corpus[1])
+    Counter({382: 2, 751: 1, 391: 1, 78: 1, 385: 1})
+
+    References
+    ----------
+    [^1]: [Weinberger, K., Dasgupta, A., Langford, J., Smola, A. and Attenberg, J., 2009. Feature hashing for large scale multitask learning. In Proceedings of the 26th annual international conference on machine learning (pp. 1113-1120).](https://arxiv.org/abs/0902.2206)
+
+    """
+
+    def __init__(
+        self,
+        n_features=1048576,
+        alternate_sign=True,
+        on: str = None,
+        strip_accents=True,
+        lowercase=True,
+        preprocessor: typing.Callable = None,
+        tokenizer: typing.Callable = None,
+        ngram_range=(1, 1),
+    ):
+        super().__init__(
+            on=on,
+            strip_accents=strip_accents,
+            lowercase=lowercase,
+            preprocessor=preprocessor,
+            tokenizer=tokenizer,
+            ngram_range=ngram_range,
+        )
+        self.n_features = n_features
+        self.alternate_sign = alternate_sign
+
+    def transform_one(self, x):
+
+        x_hashed = collections.Counter()
+
+        # Each distinct token is only hashed once
+        for token, count in self._count_tokens(x).items():
+            h = _hash_token(token)
+            if self.alternate_sign and h & 0x80000000:
+                count = -count
+            x_hashed[h % self.n_features] += count
+
+        # Colliding tokens with opposite signs may have cancelled each other out
+        return collections.Counter({i: count for i, count in x_hashed.items() if count})
+
+    def transform_many(self, X: pd.Series) -> pd.DataFrame:
+        """Transform pandas series of string into hashed term-frequency pandas sparse dataframe."""
+        indptr, indices, data = [0], [], []
+        index = {}
+
+        for d in X:
+            for i, f in self.transform_one(d).items():
+                indices.append(index.setdefault(i, len(index)))
+                data.append(f)
+
+            indptr.append(len(data))
+
+        return pd.DataFrame.sparse.from_spmatrix(
+            sparse.csr_matrix((data, indices, indptr)),
+            index=X.index,
+            columns=index.keys(),
+        )
+
+
 class TFIDF(BagOfWords):
     """Computes TF-IDF values from sentences.
 
@@ -329,11 +572,16 @@ class TFIDF(BagOfWords):
         that `min_n <= n <= max_n` will be used. For example an `ngram_range` of `(1, 1)` means
         only unigrams, `(1, 2)` means unigrams and bigrams, and `(2, 2)` means only bigrams. Only
         works if `tokenizer` is not set to `False`.
+    df_buckets
+        If set, the document counts are not stored per term, but in a fixed-size array of
+        `df_buckets` counters into which the terms are hashed. This bounds the memory used by the
+        document counts, at the cost of overestimating the counts of colliding terms.
 
     Attributes
     ----------
-    dfs : collections.defaultdict)
-        Document counts.
+    dfs : collections.Counter or numpy.ndarray
+        Document counts. These are stored in an array of `df_buckets` hashed counters if
+        `df_buckets` is set.
     n : int
         Number of scanned documents.
 
@@ -375,6 +623,10 @@ class TFIDF(BagOfWords):
 
     """
 
+    # Below this number of distinct terms, the TF-IDF values are computed in plain Python, which
+    # is faster than paying for the overhead of creating NumPy arrays
+    _NUMPY_MIN_TERMS = 50
+
     def __init__(
         self,
         normalize=True,
@@ -384,6 +636,7 @@ class TFIDF(BagOfWords):
         preprocessor: typing.Callable = None,
         tokenizer: typing.Callable = None,
         ngram_range=(1, 1),
+        df_buckets: int = None,
     ):
         super().__init__(
             on=on,
@@ -394,33 +647,81 @@ class TFIDF(BagOfWords):
             ngram_range=ngram_range,
         )
         self.normalize = normalize
-        self.dfs = collections.Counter()
+        self.df_buckets = df_buckets
+        self.dfs: typing.Union[collections.Counter, np.ndarray] = (
+            collections.Counter()
+            if df_buckets is None
+            else np.zeros(df_buckets, dtype=np.int32)
+        )
         self.n = 0
 
     def learn_one(self, x):
 
         # Update the document counts
-        terms = self.process_text(x)
-        self.dfs.update(set(terms))
+        terms = set(self._process_text(x))
+        if self.df_buckets is None:
+            self.dfs.update(terms)
+        else:
+            # A bucket is counted at most once per document, even when several of the document's
+            # terms fall into it, which ensures the document counts never exceed n
+            buckets = [_hash_token(term) % self.df_buckets for term in terms]
+            buckets = np.unique(np.array(buckets, dtype=int))
+            self.dfs[buckets] += 1
 
         # Increment the global document counter
         self.n += 1
 
         return self
 
-    def transform_one(self, x):
+    def _get_dfs(self, terms: typing.List[N_GRAM]) -> np.ndarray:
+        if self.df_buckets is None:
+            return np.fromiter(
+                (self.dfs[term] for term in terms), dtype=float, count=len(terms)
+            )
+        return self.dfs[[_hash_token(term) % self.df_buckets for term in terms]]
 
-        term_counts = super().transform_one(x)
-        n_terms = sum(term_counts.values())
+    def _transform_short(self, term_counts: collections.Counter) -> dict:
+        """Compute the TF-IDF values of a document with few terms, without using NumPy."""
 
-        tfidfs = {}
+        if self.df_buckets is None:
+            dfs = map(self.dfs.__getitem__, term_counts)
+        else:
+            dfs = self._get_dfs(list(term_counts)).tolist()
 
-        for term, count in term_counts.items():
-            tf = count / n_terms
-            idf = math.log(((1 + self.n) / (1 + self.dfs[term]))) + 1
-            tfidfs[term] = tf * idf
+        n_tokens = sum(term_counts.values())
+        log_n = math.log1p(self.n) + 1
+        tfidfs = {
+            term: count / n_tokens * (log_n - math.log1p(df))
+            for (term, count), df in zip(term_counts.items(), dfs)
+        }
 
         if self.normalize:
-            norm = math.sqrt(sum(tfidf ** 2 for tfidf in tfidfs.values()))
+            norm = math.sqrt(sum(tfidf * tfidf for tfidf in tfidfs.values()))
             return {term: tfidf / norm for term, tfidf in tfidfs.items()}
         return tfidfs
+
+    def transform_one(self, x):
+
+        term_counts = self._count_tokens(x)
+        n_terms = len(term_counts)
+
+        if n_terms < self._NUMPY_MIN_TERMS:
+            return self._transform_short(term_counts)
+
+        terms = list(term_counts)
+
+        # The IDF formula log((1 + n) / (1 + df)) + 1 is split into log(1 + n) - log(1 + df) + 1,
+        # so that the logarithms of the document counts are taken in a single vectorized call
+        idfs = math.log1p(self.n) + 1 - np.log1p(self._get_dfs(terms))
+
+        # The TF-IDF values are computed for all the terms at once, in place so that no temporary
+        # arrays are allocated
+        tfidfs = np.fromiter(term_counts.values(), dtype=float, count=n_terms)
+        tfidfs /= tfidfs.sum()
+        tfidfs *= idfs
+
+        # The sum of squares is obtained with a single dot product
+        if self.normalize:
+            tfidfs /= np.sqrt(np.dot(tfidfs, tfidfs))
+
+        return dict(zip(terms, tfidfs.tolist()))
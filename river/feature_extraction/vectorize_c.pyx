@@ -0,0 +1,60 @@
+# cython: boundscheck=False
+# cython: wraparound=False
+
+import collections
+
+from cpython.dict cimport PyDict_GetItem, PyDict_SetItem
+from cpython.object cimport PyObject
+from cpython.unicode cimport Py_UNICODE_ISALNUM
+
+
+cdef inline bint is_word_char(Py_UCS4 c):
+    # This is how the re module defines \w for str patterns
+    return c == u'_' or Py_UNICODE_ISALNUM(c)
+
+
+cpdef count_tokens(str text):
+    """Count the tokens matched by the default tokenizer.
+
+    This is equivalent to `collections.Counter(re.findall(r"(?u)\\b\\w\\w+\\b", text))`, but
+    the text is scanned and the tokens are counted in one pass, without building the intermediate
+    list of tokens. A token is a maximal run of at least two word characters.
+
+    Parameters
+    ----------
+    text
+        The text to tokenize.
+
+    """
+    cdef:
+        Py_ssize_t n = len(text)
+        Py_ssize_t i = 0
+        Py_ssize_t start
+        PyObject *count
+        str token
+
+    counts = collections.Counter()
+
+    while i < n:
+
+        if not is_word_char(text[i]):
+            i += 1
+            continue
+
+        start = i
+        i += 1
+        while i < n and is_word_char(text[i]):
+            i += 1
+
+        if i - start < 2:
+            continue
+
+        # Counter is a dict subclass, hence the dict C API can be used to update it
+        token = text[start:i]
+        count = PyDict_GetItem(counts, token)
+        if count is NULL:
+            PyDict_SetItem(counts, token, 1)
+        else:
+            PyDict_SetItem(counts, token, <object>count + 1)
+
+    return counts
@@ -1,4 +1,3 @@
-import itertools
 import typing
 
 import numpy as np
@@ -15,6 +14,10 @@ class KNeighborsBuffer:
     ----------
     window_size
         The size of the window.
+    target_dtype
+        The data type of the array in which the targets are stored. Real-valued targets can be
+        stored in a `float` array, whereas other kinds of targets, such as class labels, require
+        an `object` array.
 
     Raises
     ------
@@ -34,8 +37,9 @@ class KNeighborsBuffer:
 
     """
 
-    def __init__(self, window_size: int = 1000):
+    def __init__(self, window_size: int = 1000, target_dtype: type = object):
         self.window_size = window_size
+        self.target_dtype = target_dtype
         self._n_features: int = -1
         self._n_targets: int = -1
         self._size: int = 0
@@ -43,14 +47,18 @@ class KNeighborsBuffer:
         self._oldest: int = 0
         self._imask: np.ndarray
         self._X: np.ndarray
-        self._y: typing.List
+        self._X_sq_norms: np.ndarray
+        self._y: np.ndarray
         self._is_initialized: bool = False
+        # Incremented each time the content of the buffer changes
+        self._version: int = 0
 
     def _configure(self):
         # Binary instance mask to filter data in the buffer
         self._imask = np.zeros(self.window_size, dtype=bool)
         self._X = np.zeros((self.window_size, self._n_features))
-        self._y = [None for _ in range(self.window_size)]
+        self._X_sq_norms = np.zeros(self.window_size)
+        self._y = np.empty(self.window_size, dtype=self.target_dtype)
         self._is_initialized = True
 
     def reset(self):
@@ -62,8 +70,10 @@ class KNeighborsBuffer:
         self._oldest = 0
         self._imask = None
         self._X = None
+        self._X_sq_norms = None
         self._y = None
         self._is_initialized = False
+        self._version += 1
 
         return self
 
@@ -99,6 +109,9 @@ class KNeighborsBuffer:
             )
 
         self._X[self._next_insert, :] = x
+        self._X_sq_norms[self._next_insert] = np.dot(
+            self._X[self._next_insert], self._X[self._next_insert]
+        )
         self._y[self._next_insert] = y
 
         slot_replaced = self._imask[self._next_insert]
@@ -116,6 +129,8 @@ class KNeighborsBuffer:
         else:  # Actual buffer increased
             self._size += 1
 
+        self._version += 1
+
         return self
 
     def pop(self) -> typing.Union[typing.Tuple[np.ndarray, base.typing.Target], None]:
@@ -127,6 +142,7 @@ class KNeighborsBuffer:
             x, y = self._X[self._next_insert], self._y[self._next_insert]
             self._imask[self._next_insert] = False  # Mark slot as free
             self._size -= 1
+            self._version += 1
 
             return x, y
         else:
@@ -146,6 +162,7 @@ class KNeighborsBuffer:
                 # Shift circular buffer and make its starting point be the index 0
                 self._oldest = self._next_insert = 0
             self._size -= 1
+            self._version += 1
 
             return x, y
 
@@ -156,24 +173,45 @@ class KNeighborsBuffer:
         self._size = 0
         # Just reset the instance filtering mask, not the buffers
         self._imask = np.zeros(self.window_size, dtype=bool)
+        self._version += 1
 
         return self
 
+    def _filled(self, buffer: np.ndarray) -> np.ndarray:
+        # There is no need to filter the instances once every slot has been filled. The buffer
+        # itself is then returned through a read-only view, which avoids a copy while preventing
+        # the caller from altering the window.
+        if self._size == self.window_size:
+            view = buffer.view()
+            view.flags.writeable = False
+            return view
+        return buffer[self._imask]  # Only return the actually filled instances
+
     @property
     def features_buffer(self) -> np.ndarray:
         """Get the features buffer.
 
-        The shape of the buffer is (window_size, n_features).
+        The shape of the buffer is (window_size, n_features). Once the window is full, this is a
+        read-only view of the window, which therefore changes when new samples are appended.
         """
-        return self._X[self._imask]  # Only return the actually filled instances
+        return self._filled(self._X)
 
     @property
-    def targets_buffer(self) -> typing.List:
+    def sq_norms_buffer(self) -> np.ndarray:
+        """Get the squared L2 norms of the samples in the features buffer.
+
+        Once the window is full, this is a read-only view of the window.
+        """
+        return self._filled(self._X_sq_norms)
+
+    @property
+    def targets_buffer(self) -> np.ndarray:
         """Get the targets buffer
 
-        The shape of the buffer is (window_size, n_targets).
+        The shape of the buffer is (window_size, n_targets). Once the window is full, this is a
+        read-only view of the window, which therefore changes when new samples are appended.
         """
-        return list(itertools.compress(self._y, self._imask))
+        return self._filled(self._y)
 
     @property
     def n_targets(self) -> int:
@@ -194,6 +232,9 @@ class KNeighborsBuffer:
 class BaseNeighbors:
     """Base class for neighbors-based estimators. """
 
+    # The data type in which the targets are stored, see KNeighborsBuffer
+    _target_dtype: type = object
+
     def __init__(
         self,
         n_neighbors: int = 5,
@@ -213,21 +254,85 @@ class BaseNeighbors:
                 "Values must be greater than or equal to 1".format(p)
             )
         self.p = p
-        self.data_window = KNeighborsBuffer(window_size=window_size)
+        self.data_window = KNeighborsBuffer(
+            window_size=window_size, target_dtype=self._target_dtype
+        )
+        self._tree: typing.Optional[cKDTree] = None
+        self._tree_version: int = -1
+        self._last_query_version: int = -1
 
     def _get_neighbors(self, x):
+        version = self.data_window._version
+
+        # Building a KDTree is more expensive than scanning the window once, therefore the tree
+        # is only built when the same window is queried more than once. Both searches return the
+        # same neighbors, ties included, so that the result doesn't depend on past queries.
+        if self._tree_version != version and self._last_query_version != version:
+            self._last_query_version = version
+            return self._get_neighbors_brute_force(x)
+        self._last_query_version = version
+
+        # The KDTree is only rebuilt when the window has changed since it was last built
         X = self.data_window.features_buffer
-        tree = cKDTree(X, leafsize=self.leaf_size, **self._kwargs)
-        dist, idx = tree.query(x.reshape(1, -1), k=self.n_neighbors, p=self.p)
+        if self._tree is None or self._tree_version != version:
+            self._tree = cKDTree(X, leafsize=self.leaf_size, **self._kwargs)
+            self._tree_version = version
+
+        if len(X) <= self.n_neighbors:
+            return self._select_neighbors(X, x, np.arange(len(X)))
+
+        # Every sample which is as close as the k-th nearest neighbor is a candidate, the margin
+        # accounts for rounding differences between the tree and the exact distances
+        (radius,), _ = self._tree.query(x, k=[self.n_neighbors], p=self.p)
+        candidates = self._tree.query_ball_point(x, r=radius * (1 + 1e-9), p=self.p)
+        return self._select_neighbors(X, x, np.asarray(candidates, dtype=int))
+
+    def _get_neighbors_brute_force(self, x):
+        X = self.data_window.features_buffer
+        n, k = len(X), self.n_neighbors
+
+        if n <= k:
+            return self._select_neighbors(X, x, np.arange(n))
+
+        if self.p == 2:
+            # The Euclidean distances are ranked with a single matrix-vector product, by using the
+            # fact that ||a - b||^2 = ||a||^2 - 2 a.b + ||b||^2
+            sq_norms = self.data_window.sq_norms_buffer
+            scores = sq_norms - 2 * (X @ x) + x @ x
+            # Upper bound on the rounding error of the above expansion
+            tol = 1e-10 * (sq_norms.max() + x @ x)
+        else:
+            scores = np.linalg.norm(X - x, ord=self.p, axis=1)
+            tol = 0.0
+
+        # The k-th smallest score is found in O(n), and every sample which might be as close as it
+        # is a candidate
+        kth_score = np.partition(scores, k - 1)[k - 1]
+        candidates = np.flatnonzero(scores <= kth_score * (1 + 1e-9) + tol)
+        return self._select_neighbors(X, x, candidates)
+
+    def _select_neighbors(self, X, x, candidates):
+        """Select the k nearest neighbors among a set of candidates.
+
+        The exact distances of the candidates are computed, and ties are broken in favor of the
+        samples which come first in the window.
+
+        """
+        dist = np.linalg.norm(X[candidates] - x, ord=self.p, axis=1)
+        order = np.lexsort((candidates, dist))[: self.n_neighbors]
+        idx, dist = candidates[order], dist[order]
+
+        # The missing neighbors are reported in the same way as cKDTree.query does
+        n_missing = self.n_neighbors - len(idx)
+        if n_missing > 0:
+            dist = np.append(dist, np.full(n_missing, np.inf))
+            idx = np.append(idx, np.full(n_missing, len(X)))
 
-        # We make sure dist and idx is 2D since when k = 1 dist is one dimensional.
-        if not isinstance(dist[0], np.ndarray):
-            dist = [dist]
-            idx = [idx]
-        return dist, idx
+        return dist.reshape(1, -1), idx.reshape(1, -1)
 
     def reset(self) -> "BaseNeighbors":
         """Reset estimator. """
         self.data_window.reset()
+        self._tree = None
 
         return self
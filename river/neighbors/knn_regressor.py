@@ -1,3 +1,6 @@
+import operator
+import typing
+
 import numpy as np
 
 from river import base
@@ -69,6 +72,9 @@ class KNNRegressor(BaseNeighbors, base.Regressor):
     _MEDIAN = "median"
     _WEIGHTED_MEAN = "weighted_mean"
 
+    # The targets are real numbers, hence they are stored in a contiguous float array
+    _target_dtype = np.float64
+
     def __init__(
         self,
         n_neighbors: int = 5,
@@ -96,9 +102,53 @@ class KNNRegressor(BaseNeighbors, base.Regressor):
         self.aggregation_method = aggregation_method
         self.kwargs = kwargs
 
+        # The aggregation function is resolved once, instead of at each prediction
+        self._aggregate = {
+            self._MEAN: self._aggregate_mean,
+            self._MEDIAN: self._aggregate_median,
+            self._WEIGHTED_MEAN: self._aggregate_weighted_mean,
+        }[aggregation_method]
+
+        # The features are written in a reusable buffer, in the same order as dict2numpy
+        self._feature_names: typing.Optional[typing.List] = None
+        self._get_features: typing.Optional[operator.itemgetter] = None
+        self._x_arr = np.empty(0)
+
     def _unit_test_skips(self):
         return {"check_emerging_features", "check_disappearing_features"}
 
+    @staticmethod
+    def _aggregate_mean(neighbor_vals, dists):
+        return np.mean(neighbor_vals)
+
+    @staticmethod
+    def _aggregate_median(neighbor_vals, dists):
+        return np.median(neighbor_vals)
+
+    @staticmethod
+    def _aggregate_weighted_mean(neighbor_vals, dists):
+        weights = 1 / dists
+        return np.dot(weights, neighbor_vals) / weights.sum()
+
+    def _to_numpy(self, x: dict) -> np.ndarray:
+        if self._feature_names is None and x:
+            self._feature_names = sorted(x, key=str)
+            self._get_features = operator.itemgetter(*self._feature_names)
+            self._x_arr = np.empty(len(self._feature_names))
+
+        # Fall back to dict2numpy if the features are not the ones that were first observed
+        if self._feature_names is None or len(x) != len(self._feature_names):
+            return dict2numpy(x)
+        try:
+            self._x_arr[:] = self._get_features(x)
+        except KeyError:
+            return dict2numpy(x)
+        return self._x_arr
+
+    def reset(self):
+        self._feature_names = None
+        return super().reset()
+
     def learn_one(self, x, y):
         """Update the model with a set of features `x` and a real target value `y`.
 
@@ -121,7 +171,7 @@ class KNNRegressor(BaseNeighbors, base.Regressor):
 
         """
 
-        x_arr = dict2numpy(x)
+        x_arr = self._to_numpy(x)
         self.data_window.append(x_arr, y)
 
         return self
@@ -146,7 +196,7 @@ class KNNRegressor(BaseNeighbors, base.Regressor):
             # Not enough information available, return default prediction
             return 0.0
 
-        x_arr = dict2numpy(x)
+        x_arr = self._to_numpy(x)
 
         dists, neighbor_idx = self._get_neighbors(x_arr)
         target_buffer = self.data_window.targets_buffer
@@ -155,24 +205,9 @@ class KNNRegressor(BaseNeighbors, base.Regressor):
         if dists[0][0] == 0:
             return target_buffer[neighbor_idx[0][0]]
 
-        if self.data_window.size < self.n_neighbors:  # Select only the valid neighbors
-            neighbor_vals = [
-                target_buffer[index]
-                for cnt, index in enumerate(neighbor_idx[0])
-                if cnt < self.data_window.size
-            ]
-            dists = [
-                dist for cnt, dist in enumerate(dists[0]) if cnt < self.data_window.size
-            ]
-        else:
-            neighbor_vals = [target_buffer[index] for index in neighbor_idx[0]]
-            dists = dists[0]
-
-        if self.aggregation_method == self._MEAN:
-            return np.mean(neighbor_vals)
-        elif self.aggregation_method == self._MEDIAN:
-            return np.median(neighbor_vals)
-        else:  # weighted mean
-            return sum(y / d for y, d in zip(neighbor_vals, dists)) / sum(
-                1 / d for d in dists
-            )
+        # Select only the valid neighbors, the missing ones are placed at the end by the KDTree
+        neighbor_idx = neighbor_idx[0][: self.data_window.size]
+        dists = dists[0][: self.data_window.size]
+        neighbor_vals = target_buffer[neighbor_idx]
+
+        return self._aggregate(neighbor_vals, dists)
@@ -0,0 +1,94 @@
+import numpy as np
+from scipy.spatial import cKDTree
+
+from river import neighbors
+
+
+def test_brute_force_matches_kdtree_on_large_features():
+    """The brute-force search must not lose precision when the features are large compared to
+    the gaps between the samples."""
+
+    rng = np.random.RandomState(42)
+
+    for _ in range(50):
+        center = rng.uniform(1000, 2000, size=4)
+        model = neighbors.KNNRegressor(n_neighbors=3, window_size=100)
+        for x in center + 0.05 * rng.rand(100, 4):
+            model.learn_one(dict(enumerate(x)), 0.0)
+
+        x = center + 0.05 * rng.rand(4)
+        dist, idx = model._get_neighbors_brute_force(x)
+        tree_dist, tree_idx = cKDTree(model.data_window.features_buffer).query(x, k=3)
+
+        assert np.array_equal(idx[0], tree_idx)
+        assert np.allclose(dist[0], tree_dist)
+
+
+def test_distinct_large_inputs_are_not_confused():
+    model = neighbors.KNNRegressor()
+    for t, y in [(1.6e9, 1.0), (1.6e9 + 50, 2.0), (1.6e9 + 100, 3.0)]:
+        model.learn_one({"t": t}, y)
+
+    assert model.predict_one({"t": 1.6e9 + 20}) == 2.0
+    assert model.predict_one({"t": 1.6e9 + 50}) == 2.0
+
+
+def test_brute_force_matches_kdtree_with_ties():
+    """The first query on a window is answered by brute force, and the following ones by a
+    KDTree. Both must return the same neighbors, in the same order, even when there are ties."""
+
+    rng = np.random.RandomState(42)
+
+    for p in (1, 2, 3):
+        for _ in range(50):
+            model = neighbors.KNNRegressor(n_neighbors=4, window_size=30, p=p)
+            # Features on a small integer grid produce many equidistant samples
+            for x in rng.randint(0, 4, size=(rng.randint(1, 40), 3)):
+                model.learn_one(dict(enumerate(x)), 0.0)
+
+            x = rng.randint(0, 4, size=3) + rng.choice([0, 0.5], size=3)
+            brute_dist, brute_idx = model._get_neighbors(x)
+            tree_dist, tree_idx = model._get_neighbors(x)
+            assert model._tree is not None
+
+            assert np.array_equal(brute_idx, tree_idx)
+            assert np.array_equal(brute_dist, tree_dist)
+
+
+def test_repeated_predictions_are_identical():
+    model = neighbors.KNNRegressor(n_neighbors=3, aggregation_method="median")
+    for a in range(10):
+        model.learn_one({"a": a}, float(a))
+
+    assert [model.predict_one({"a": 4.5}) for _ in range(3)] == [4.0, 4.0, 4.0]
+
+
+def test_classifier_accepts_labels_of_any_type():
+    model = neighbors.KNNClassifier(n_neighbors=1)
+    for a, y in [(0, 1.0), (1, "x"), (2, "y")]:
+        model.learn_one({"a": a}, y)
+
+    assert [model.predict_one({"a": a}) for a in range(3)] == [1.0, "x", "y"]
+
+
+def test_regressor_stores_integer_targets_as_floats():
+    model = neighbors.KNNRegressor()
+    for a in range(3):
+        model.learn_one({"a": a}, a)
+
+    assert model.data_window.targets_buffer.dtype == np.float64
+    assert model.predict_one({"a": 1}) == 1.0
+
+
+def test_full_window_buffers_are_read_only():
+    model = neighbors.KNNRegressor(window_size=3)
+    for a in range(5):
+        model.learn_one({"a": a}, float(a))
+
+    window = model.data_window
+    for buffer in (
+        window.features_buffer,
+        window.sq_norms_buffer,
+        window.targets_buffer,
+    ):
+        assert not buffer.flags.writeable